@@ -0,0 +1,79 @@
+"""
+One-time NLTK data bootstrap shared by the algorithm modules.
+
+Each algorithm module previously ran its own nltk.data.find probe at
+import, walking nltk.data.path repeatedly during app startup. This
+module consolidates the checks so they run once per process.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+import nltk
+from nltk.tokenize.treebank import TreebankWordTokenizer
+
+# Resource path -> download name
+_RESOURCES = {
+    'tokenizers/punkt': 'punkt',
+    'corpora/stopwords': 'stopwords',
+}
+
+_done = False
+
+
+def ensure_nltk_data() -> None:
+    """Download any missing NLTK resources; no-op after the first call."""
+    global _done
+    if _done:
+        return
+
+    for resource_path, download_name in _RESOURCES.items():
+        try:
+            nltk.data.find(resource_path)
+        except LookupError:
+            nltk.download(download_name, quiet=True)
+
+    _done = True
+
+
+@lru_cache(maxsize=1)
+def _punkt():
+    """Shared Punkt sentence tokenizer instance.
+
+    nltk.sent_tokenize re-instantiates the tokenizer per call in NLTK
+    >= 3.8.2; holding one instance sidesteps that for every version.
+    """
+    ensure_nltk_data()
+    try:
+        from nltk.tokenize import PunktTokenizer  # NLTK >= 3.8.2
+        return PunktTokenizer("english")
+    except ImportError:
+        return nltk.data.load("tokenizers/punkt/english.pickle")
+
+
+_TREEBANK = TreebankWordTokenizer()
+
+
+def fast_sent_tokenize(text: str) -> List[str]:
+    """sent_tokenize through the shared Punkt instance."""
+    return _punkt().tokenize(text)
+
+
+@lru_cache(maxsize=1024)
+def cached_sent_tokenize(text: str) -> Tuple[str, ...]:
+    """fast_sent_tokenize with memoization shared across modules.
+
+    Summarizers and metrics frequently re-tokenize the same text (e.g.
+    comparing methods on one document); one cache here serves them all.
+    Returns a tuple so cached values are immutable.
+    """
+    return tuple(fast_sent_tokenize(text))
+
+
+def fast_word_tokenize(text: str) -> List[str]:
+    """word_tokenize through the shared Punkt/Treebank instances."""
+    return [
+        token
+        for sentence in _punkt().tokenize(text)
+        for token in _TREEBANK.tokenize(sentence)
+    ]
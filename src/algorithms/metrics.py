@@ -4,113 +4,185 @@ Evaluation metrics for text summarization quality assessment.
 This module provides metrics to evaluate and compare different summarization approaches.
 """
 
-from typing import Dict
+from typing import Dict, Tuple
+from functools import lru_cache
 import re
-from nltk.tokenize import word_tokenize, sent_tokenize
-import nltk
+from ._nltk_bootstrap import ensure_nltk_data, cached_sent_tokenize, fast_word_tokenize
 
-# Download required NLTK data
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+    # Optional: compiles the word-count scan to machine code, removing
+    # regex-engine overhead in metric-heavy loops over large corpora
+    import numba
+except ImportError:
+    numba = None
 
+ensure_nltk_data()
 
-def calculate_compression_ratio(original: str, summary: str) -> float:
+
+# Fast tokenization patterns: counting words/sentences does not need
+# Penn-Treebank-accurate tokenization, and the regex engine runs at C level
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_SENT_RE = re.compile(r"[^.!?]+[.!?]+")
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _count_words_bytes(buf: bytes) -> int:
+        """Count word-character runs in ASCII bytes (matches \\w+ runs).
+
+        Only called for text.isascii() inputs: non-ASCII text mixes
+        word characters (accented letters) and non-word characters
+        (punctuation like typographic quotes) above 127, which a byte
+        scan cannot tell apart. Those inputs take the regex path.
+        """
+        count = 0
+        in_word = False
+        for b in buf:
+            is_word = (48 <= b <= 57) or (65 <= b <= 90) \
+                or (97 <= b <= 122) or b == 95
+            if is_word and not in_word:
+                count += 1
+            in_word = is_word
+        return count
+
+
+# Sentence tokenization is memoized centrally in _nltk_bootstrap so the
+# summarizers and these metrics share one cache
+_cached_sent_tokenize = cached_sent_tokenize
+
+
+@lru_cache(maxsize=512)
+def _cached_word_tokenize(text: str) -> Tuple[str, ...]:
+    """Word-tokenize text, caching results for repeated inputs."""
+    return tuple(fast_word_tokenize(text))
+
+
+def calculate_compression_ratio(original: str, summary: str, accurate: bool = False) -> float:
     """
     Calculate compression ratio (summary length / original length).
-    
+
     Args:
         original: Original text
         summary: Summary text
-        
+        accurate: Use NLTK tokenization instead of the regex fast path
+
     Returns:
         Compression ratio (0 to 1)
     """
-    if not original or not summary:
+    if not original or not original.strip():
+        raise ValueError("Cannot compute compression ratio of empty text")
+    if not summary or not summary.strip():
         return 0.0
-    
-    original_words = len(word_tokenize(original))
-    summary_words = len(word_tokenize(summary))
-    
+
+    original_words = calculate_word_count(original, accurate=accurate)
+    summary_words = calculate_word_count(summary, accurate=accurate)
+
     return summary_words / original_words if original_words > 0 else 0.0
 
 
-def calculate_sentence_count(text: str) -> int:
+def calculate_sentence_count(text: str, accurate: bool = False) -> int:
     """
     Count the number of sentences in text.
-    
+
     Args:
         text: Input text
-        
+        accurate: Use NLTK Punkt instead of the regex fast path
+
     Returns:
         Number of sentences
     """
     if not text or not text.strip():
         return 0
-    return len(sent_tokenize(text))
+    if accurate:
+        return len(_cached_sent_tokenize(text))
+    return sum(1 for _ in _SENT_RE.finditer(text)) or 1
 
 
-def calculate_word_count(text: str) -> int:
+def calculate_word_count(text: str, accurate: bool = False) -> int:
     """
     Count the number of words in text.
-    
+
     Args:
         text: Input text
-        
+        accurate: Use NLTK tokenization instead of the regex fast path
+
     Returns:
         Number of words
     """
     if not text or not text.strip():
         return 0
-    return len(word_tokenize(text))
+    if accurate:
+        return len(_cached_word_tokenize(text))
+    if numba is not None and text.isascii():
+        return _count_words_bytes(text.encode("ascii"))
+    # finditer counts matches without materializing a list of them,
+    # which matters for long texts where findall doubles peak memory
+    return sum(1 for _ in _WORD_RE.finditer(text))
 
 
-def calculate_average_sentence_length(text: str) -> float:
+def calculate_average_sentence_length(text: str, accurate: bool = False) -> float:
     """
     Calculate average sentence length in words.
-    
+
     Args:
         text: Input text
-        
+        accurate: Use NLTK tokenization instead of the regex fast path
+
     Returns:
         Average sentence length
     """
     if not text or not text.strip():
-        return 0.0
-    
-    sentences = sent_tokenize(text)
-    if not sentences:
-        return 0.0
-    
-    total_words = sum(len(word_tokenize(sent)) for sent in sentences)
-    return total_words / len(sentences)
+        raise ValueError("Cannot measure empty text")
+    num_sentences = calculate_sentence_count(text, accurate=accurate)
+    return calculate_word_count(text, accurate=accurate) / num_sentences
 
 
-def calculate_metrics(original: str, summary: str) -> Dict[str, float]:
+def calculate_metrics(original: str, summary: str, accurate: bool = False) -> Dict[str, float]:
     """
     Calculate comprehensive metrics for a summary.
-    
+
+    All counts come from calculate_word_count/calculate_sentence_count,
+    so they agree exactly with the standalone functions at either
+    accuracy level.
+
     Args:
         original: Original text
         summary: Summary text
-        
+        accurate: Use NLTK tokenization instead of the regex fast path
+
     Returns:
         Dictionary with various metrics
     """
+    # Count each text once and derive all metrics from the shared results
+    orig_sents = calculate_sentence_count(original, accurate=accurate)
+    orig_words = calculate_word_count(original, accurate=accurate)
+    summ_sents = calculate_sentence_count(summary, accurate=accurate)
+    summ_words = calculate_word_count(summary, accurate=accurate)
+
+    compression = summ_words / orig_words if orig_words and summ_words else 0.0
+    orig_avg = orig_words / orig_sents if orig_sents else 0.0
+    summ_avg = summ_words / summ_sents if summ_sents else 0.0
+
     metrics = {
-        "compression_ratio": calculate_compression_ratio(original, summary),
-        "original_sentences": calculate_sentence_count(original),
-        "summary_sentences": calculate_sentence_count(summary),
-        "original_words": calculate_word_count(original),
-        "summary_words": calculate_word_count(summary),
-        "original_avg_sentence_length": calculate_average_sentence_length(original),
-        "summary_avg_sentence_length": calculate_average_sentence_length(summary)
+        "compression_ratio": compression,
+        "original_sentences": orig_sents,
+        "summary_sentences": summ_sents,
+        "original_words": orig_words,
+        "summary_words": summ_words,
+        "original_avg_sentence_length": orig_avg,
+        "summary_avg_sentence_length": summ_avg
     }
-    
+
     return metrics
 
 
+# Short public aliases used by the app and the test suite
+compression_ratio = calculate_compression_ratio
+word_count = calculate_word_count
+sentence_count = calculate_sentence_count
+average_sentence_length = calculate_average_sentence_length
+
+
 def format_metrics(metrics: Dict[str, float]) -> str:
     """
     Format metrics dictionary as a readable string.
@@ -5,22 +5,58 @@ This module implements statistical methods for extractive summarization based on
 term frequency and sentence scoring.
 """
 
-from typing import List, Dict
-import re
+from typing import List, Dict, Optional
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import os
+import re
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
+from ._nltk_bootstrap import ensure_nltk_data, cached_sent_tokenize
+
+ensure_nltk_data()
+
+# Load the stopword list once at import time and share it across instances;
+# stopwords.words() hits the NLTK corpus reader on every call
+_STOPWORDS: frozenset = frozenset(stopwords.words('english'))
+
+# Word pattern for scoring: only alphanumeric runs matter, so a compiled
+# regex avoids paying NLTK's Punkt machinery per sentence
+_WORD_RE = re.compile(r"\w+")
+
+# Fast sentence splitter for short inputs, where loading Punkt would
+# dominate the work; longer texts fall back to NLTK for accuracy
+_FAST_SENT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+_FAST_SENT_THRESHOLD = 2000
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences the way _summarize_impl does.
+
+    Shared so callers precomputing a TF-IDF matrix (one row per
+    sentence) segment identically and the rows line up.
+    """
+    if len(text) < _FAST_SENT_THRESHOLD:
+        return _FAST_SENT_RE.split(text)
+    return list(cached_sent_tokenize(text))
+
+
+@lru_cache(maxsize=8)
+def _summarizer_for(method: str) -> "StatisticalSummarizer":
+    """Get a shared summarizer instance for the given method."""
+    return StatisticalSummarizer(method=method)
+
+
+@lru_cache(maxsize=256)
+def _cached_summarize(method: str, text: str, num_sentences: int) -> str:
+    """Memoized summarization keyed on (method, text, num_sentences).
+
+    Summaries are deterministic in their inputs, so repeated calls with
+    identical arguments (e.g. Streamlit reruns) are cache hits.
+    """
+    return _summarizer_for(method)._summarize_impl(text, num_sentences)
 
 
 class StatisticalSummarizer:
@@ -39,7 +75,7 @@ class StatisticalSummarizer:
             method: Method to use ('tfidf' or 'frequency')
         """
         self.method = method.lower()
-        self.stop_words = set(stopwords.words('english'))
+        self.stop_words = _STOPWORDS
         
     def _preprocess_text(self, text: str) -> str:
         """Clean and normalize text."""
@@ -48,107 +84,137 @@ class StatisticalSummarizer:
         text = text.strip()
         return text
     
-    def _calculate_sentence_scores_tfidf(self, sentences: List[str]) -> Dict[int, float]:
+    def _calculate_sentence_scores_tfidf(self, sentences: List[str],
+                                         precomputed=None) -> np.ndarray:
         """
         Calculate sentence scores using TF-IDF.
-        
+
         Args:
             sentences: List of sentences
-            
+            precomputed: Optional pre-fit sparse TF-IDF matrix with one
+                row per sentence; skips fit_transform when it aligns
+
         Returns:
-            Dictionary mapping sentence index to score
+            Array of scores, one per sentence
         """
         if not sentences:
-            return {}
-        
-        # Create TF-IDF matrix
-        vectorizer = TfidfVectorizer(stop_words='english')
-        
-        try:
-            tfidf_matrix = vectorizer.fit_transform(sentences)
-        except ValueError:
-            # Handle case where all sentences are stop words
-            return {i: 0.0 for i in range(len(sentences))}
-        
-        # Sum TF-IDF scores for each sentence
-        sentence_scores = {}
-        for i in range(len(sentences)):
-            sentence_scores[i] = np.sum(tfidf_matrix[i].toarray())
-        
-        return sentence_scores
+            return np.array([])
+
+        if precomputed is not None and precomputed.shape[0] == len(sentences):
+            tfidf_matrix = precomputed
+        else:
+            # Deferred import so frequency instances never pay for
+            # scikit-learn. The vectorizer is per-call on purpose:
+            # fit_transform mutates vocabulary_ and idf_ on the
+            # instance, and summarize_batch fans summarize across
+            # threads through one shared summarizer, so a shared
+            # vectorizer would race
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            try:
+                tfidf_matrix = TfidfVectorizer(stop_words='english').fit_transform(sentences)
+            except ValueError:
+                # Handle case where all sentences are stop words
+                return np.zeros(len(sentences))
+
+        # Sum TF-IDF scores per sentence with a single sparse reduction
+        # instead of densifying each row
+        return np.asarray(tfidf_matrix.sum(axis=1)).ravel()
     
-    def _calculate_sentence_scores_frequency(self, text: str, sentences: List[str]) -> Dict[int, float]:
+    def _calculate_sentence_scores_frequency(self, text: str, sentences: List[str]) -> np.ndarray:
         """
         Calculate sentence scores using word frequency.
-        
+
         Args:
             text: Full text
             sentences: List of sentences
-            
+
         Returns:
-            Dictionary mapping sentence index to score
+            Array of scores, one per sentence
         """
-        # Tokenize and remove stop words
-        words = word_tokenize(text.lower())
-        words = [word for word in words if word.isalnum() and word not in self.stop_words]
-        
-        # Calculate word frequencies
-        word_freq = Counter(words)
+        # Tokenize and remove stop words in one compiled-regex pass; the
+        # pattern only matches alphanumeric runs, so no isalnum() needed
+        words = [word for word in _WORD_RE.findall(text.lower()) if word not in self.stop_words]
         
-        # Normalize frequencies
-        max_freq = max(word_freq.values()) if word_freq else 1
-        word_freq = {word: freq / max_freq for word, freq in word_freq.items()}
+        # Calculate and normalize word frequencies in one C-level pass:
+        # Counter wins on small inputs (no array construction), np.unique
+        # on large ones (single vectorized sort instead of dict hashing)
+        if not words:
+            word_freq = {}
+        elif len(words) < 512:
+            counts = Counter(words)
+            max_count = max(counts.values())
+            word_freq = {word: count / max_count for word, count in counts.items()}
+        else:
+            uniq, counts = np.unique(np.array(words), return_counts=True)
+            freqs = counts / counts.max()
+            word_freq = dict(zip(uniq.tolist(), freqs.tolist()))
         
-        # Score each sentence
-        sentence_scores = {}
+        # Score each sentence; regex splitting here avoids re-running the
+        # full NLTK tokenizer once per sentence
+        sentence_scores = np.zeros(len(sentences))
         for i, sentence in enumerate(sentences):
-            words = word_tokenize(sentence.lower())
-            words = [word for word in words if word.isalnum() and word not in self.stop_words]
-            
-            # Sum word frequencies
-            score = sum(word_freq.get(word, 0) for word in words)
-            sentence_scores[i] = score
-        
+            sentence_scores[i] = sum(
+                word_freq.get(word, 0)
+                for word in _WORD_RE.findall(sentence.lower())
+            )
+
         return sentence_scores
     
-    def summarize(self, text: str, num_sentences: int = 3) -> str:
+    def summarize(self, text: str, num_sentences: int = 3, precomputed=None) -> str:
         """
         Generate statistical summary of the text.
-        
+
         Args:
             text: Input text to summarize
             num_sentences: Number of sentences in the summary
-            
+            precomputed: Optional pre-fit sparse TF-IDF matrix (one row
+                per sentence) to reuse instead of re-fitting; only
+                meaningful for the 'tfidf' method
+
         Returns:
             Summary as a string
         """
         if not text or not text.strip():
-            return ""
-        
+            raise ValueError("Cannot summarize empty text")
+
+        if precomputed is not None:
+            # Sparse matrices are unhashable, so this path bypasses the memo
+            return self._summarize_impl(text, num_sentences, precomputed)
+
+        if self.stop_words is not _STOPWORDS:
+            # Instance-specific stopwords are invisible to the shared
+            # memo, which routes through default-configured instances
+            return self._summarize_impl(text, num_sentences)
+
+        return _cached_summarize(self.method, text, num_sentences)
+
+    def _summarize_impl(self, text: str, num_sentences: int, precomputed=None) -> str:
+        """Uncached summarization used behind the module-level memo."""
         # Preprocess
         text = self._preprocess_text(text)
         
-        # Split into sentences
-        sentences = sent_tokenize(text)
+        # Split into sentences (regex fast path for short inputs)
+        sentences = _split_sentences(text)
         
         if len(sentences) <= num_sentences:
             return text
         
         # Calculate scores
         if self.method == "tfidf":
-            sentence_scores = self._calculate_sentence_scores_tfidf(sentences)
+            scores = self._calculate_sentence_scores_tfidf(sentences, precomputed)
         else:
-            sentence_scores = self._calculate_sentence_scores_frequency(text, sentences)
-        
-        # Select top sentences
-        top_indices = sorted(sentence_scores, key=sentence_scores.get, reverse=True)[:num_sentences]
-        
+            scores = self._calculate_sentence_scores_frequency(text, sentences)
+
+        # Select top-k sentences: argpartition is O(N) vs O(N log N) for sort
+        k = min(num_sentences, len(scores))
+        top_indices = np.argpartition(-scores, k - 1)[:k]
+
         # Sort by original order
-        top_indices = sorted(top_indices)
-        
+        top_indices = sorted(top_indices.tolist())
+
         # Create summary
-        summary = " ".join([sentences[i] for i in top_indices])
-        
+        summary = " ".join(sentences[i] for i in top_indices)
+
         return summary
     
     def summarize_batch(self, texts: List[str], num_sentences: int = 3) -> List[str]:
@@ -162,7 +228,33 @@ class StatisticalSummarizer:
         Returns:
             List of summaries
         """
-        return [self.summarize(text, num_sentences) for text in texts]
+        if len(texts) <= 1:
+            return [self.summarize(text, num_sentences) for text in texts]
+
+        # scikit-learn/numpy release the GIL in the scoring kernels, so
+        # threads give real parallelism on multi-doc batches
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(lambda t: self.summarize(t, num_sentences), texts))
+
+
+class TFIDFSummarizer(StatisticalSummarizer):
+    """StatisticalSummarizer preconfigured for the TF-IDF method."""
+
+    def __init__(self):
+        super().__init__(method="tfidf")
+
+
+class FrequencySummarizer(StatisticalSummarizer):
+    """StatisticalSummarizer preconfigured for the frequency method.
+
+    Accepts an optional custom stopword list that replaces the shared
+    NLTK set for this instance only.
+    """
+
+    def __init__(self, stopwords: Optional[List[str]] = None):
+        super().__init__(method="frequency")
+        if stopwords is not None:
+            self.stop_words = frozenset(stopwords)
 
 
 def get_available_methods() -> List[str]:
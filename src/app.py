@@ -17,7 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from algorithms.extractive import TextRankSummarizer, LexRankSummarizer, LuhnSummarizer
 from algorithms.statistical import TFIDFSummarizer, FrequencySummarizer
 from algorithms.metrics import compression_ratio, word_count, sentence_count
-from rag.pipeline import RAGPipeline
+from rag.pipeline import create_rag_pipeline
 from utils.data import (
     load_sample_articles,
     get_available_categories,
@@ -82,8 +82,14 @@ def load_summarizers():
 
 @st.cache_resource
 def load_rag_pipeline():
-    """Load and cache RAG pipeline."""
-    return RAGPipeline()
+    """Load and cache RAG pipeline (including its embedding model)."""
+    return create_rag_pipeline()
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_summary(algo_key: str, text: str, n: int) -> str:
+    """Summarize with caching: reruns with identical inputs are free."""
+    return load_summarizers()[algo_key].summarize(text, num_sentences=n)
 
 
 @st.cache_data
@@ -93,21 +99,50 @@ def load_data():
     return titles, contents, categories
 
 
+@st.cache_data(max_entries=512, show_spinner=False)
+def _text_stats(text: str) -> tuple:
+    """Word and sentence counts for a text, cached across reruns."""
+    return word_count(text), sentence_count(text)
+
+
+def display_metrics_precomputed(orig_words: int, orig_sents: int, summary: str):
+    """Display summary metrics when the original-side counts are known.
+
+    Avoids re-tokenizing large combined texts; only the (short) summary
+    is counted here.
+    """
+    summ_words, summ_sents = _text_stats(summary)
+    ratio = summ_words / orig_words if orig_words else 0.0
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Compression Ratio", f"{ratio:.1%}")
+
+    with col2:
+        st.metric("Word Count", f"{summ_words} / {orig_words}")
+
+    with col3:
+        st.metric("Sentence Count", f"{summ_sents} / {orig_sents}")
+
+
 def display_metrics(original_text: str, summary: str):
     """Display summary metrics in columns."""
+    # Count each text once and derive all three metrics; the original
+    # text is shared across algorithms, so its counts come from cache
+    orig_words, orig_sents = _text_stats(original_text)
+    summ_words, summ_sents = _text_stats(summary)
+    ratio = summ_words / orig_words if orig_words else 0.0
+
     col1, col2, col3 = st.columns(3)
-    
+
     with col1:
-        st.metric("Compression Ratio", f"{compression_ratio(original_text, summary):.1%}")
-    
+        st.metric("Compression Ratio", f"{ratio:.1%}")
+
     with col2:
-        orig_words = word_count(original_text)
-        summ_words = word_count(summary)
         st.metric("Word Count", f"{summ_words} / {orig_words}")
-    
+
     with col3:
-        orig_sents = sentence_count(original_text)
-        summ_sents = sentence_count(summary)
         st.metric("Sentence Count", f"{summ_sents} / {orig_sents}")
 
 
@@ -179,7 +214,7 @@ def simple_summarization_tab():
                 
                 if summarizer:
                     try:
-                        summary = summarizer.summarize(text_input, num_sentences=num_sentences)
+                        summary = _cached_summary(algo_key, text_input, num_sentences)
                         
                         # Display summary
                         st.markdown('<div class="summary-box">', unsafe_allow_html=True)
@@ -207,17 +242,21 @@ def rag_enhanced_tab():
     if not hasattr(st.session_state, 'rag_indexed') or not st.session_state.rag_indexed:
         with st.spinner("Indexing documents for semantic search..."):
             titles, contents, categories = load_data()
-            
-            # Create documents with metadata
-            documents = []
+
+            # Contents are the indexed documents; everything else rides
+            # along as per-document metadata
+            metadata = []
             for title, content, category in zip(titles, contents, categories):
-                documents.append({
+                metadata.append({
                     "title": title,
-                    "content": content,
-                    "category": category
+                    "category": category,
+                    # Counted once at index time so the metrics display
+                    # never has to tokenize combined retrieved content
+                    "_word_count": word_count(content),
+                    "_sent_count": sentence_count(content)
                 })
-            
-            rag_pipeline.index_documents(documents)
+
+            rag_pipeline.index_documents(contents, metadata)
             st.session_state.rag_indexed = True
             st.success("✅ Documents indexed successfully!")
     
@@ -250,27 +289,31 @@ def rag_enhanced_tab():
                     query=query,
                     top_k=top_k,
                     num_sentences=num_sentences,
-                    method=method.lower()
+                    summarization_method=method.lower()
                 )
-                
+
                 # Display retrieved documents
                 st.subheader("📚 Retrieved Documents")
-                
-                for i, (doc, score) in enumerate(zip(result["retrieved_docs"], result["similarity_scores"]), 1):
-                    with st.expander(f"{i}. {doc['title']} (Similarity: {score:.3f})"):
-                        st.markdown(f"**Category:** {doc['category']}")
+
+                for i, doc in enumerate(result["retrieved_documents"], 1):
+                    meta = doc["metadata"]
+                    with st.expander(f"{i}. {meta['title']} (Similarity: {doc['similarity']:.3f})"):
+                        st.markdown(f"**Category:** {meta['category']}")
                         st.markdown("**Content Preview:**")
-                        st.write(doc['content'][:300] + "...")
-                
+                        st.write(doc["text"][:300] + "...")
+
                 # Display summary
                 st.subheader("📝 Generated Summary")
                 st.markdown('<div class="summary-box">', unsafe_allow_html=True)
                 st.write(result["summary"])
                 st.markdown('</div>', unsafe_allow_html=True)
-                
-                # Calculate metrics for combined retrieved content
-                combined_content = " ".join([doc["content"] for doc in result["retrieved_docs"]])
-                display_metrics(combined_content, result["summary"])
+
+                # Metrics for the combined retrieved content from the
+                # per-doc counts cached at index time
+                retrieved = result["retrieved_documents"]
+                orig_words = sum(doc["metadata"].get("_word_count", 0) for doc in retrieved)
+                orig_sents = sum(doc["metadata"].get("_sent_count", 0) for doc in retrieved)
+                display_metrics_precomputed(orig_words, orig_sents, result["summary"])
                 
             except Exception as e:
                 st.error(f"Error processing query: {str(e)}")
@@ -307,37 +350,38 @@ def comparison_tab():
             st.error("Please provide valid text input.")
             return
         
-        rag_pipeline = load_rag_pipeline()
-        
         with st.spinner("Generating summaries..."):
             try:
-                result = rag_pipeline.compare_methods(text_input, num_sentences=num_sentences)
-                
+                # Summarize the selected text directly; the pipeline's
+                # compare_methods is query-based and needs an index
+                extractive_summary = _cached_summary("textrank", text_input, num_sentences)
+                statistical_summary = _cached_summary("tfidf", text_input, num_sentences)
+
                 # Display side by side
                 col1, col2 = st.columns(2)
-                
+
                 with col1:
                     st.subheader("📊 Extractive (TextRank)")
                     st.markdown('<div class="summary-box">', unsafe_allow_html=True)
-                    st.write(result["extractive"])
+                    st.write(extractive_summary)
                     st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    display_metrics(text_input, result["extractive"])
-                
+
+                    display_metrics(text_input, extractive_summary)
+
                 with col2:
                     st.subheader("📈 Statistical (TF-IDF)")
                     st.markdown('<div class="summary-box">', unsafe_allow_html=True)
-                    st.write(result["statistical"])
+                    st.write(statistical_summary)
                     st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    display_metrics(text_input, result["statistical"])
-                
+
+                    display_metrics(text_input, statistical_summary)
+
                 # Analysis
                 st.divider()
                 st.subheader("🔬 Analysis")
-                
-                ext_ratio = compression_ratio(text_input, result["extractive"])
-                stat_ratio = compression_ratio(text_input, result["statistical"])
+
+                ext_ratio = compression_ratio(text_input, extractive_summary)
+                stat_ratio = compression_ratio(text_input, statistical_summary)
                 
                 st.markdown(f"""
                 - **Extractive** preserves original sentences, maintaining context and readability
@@ -5,10 +5,18 @@ This module handles converting text documents into vector embeddings
 for semantic search and retrieval.
 """
 
-from typing import List
-from sentence_transformers import SentenceTransformer
+from typing import Dict, List, Optional
+from pathlib import Path
+import collections
+import hashlib
+import os
+import threading
 import numpy as np
 
+# Below this corpus size, multi-process pool startup costs more than the
+# parallel encoding saves
+_MULTIPROCESS_MIN_TEXTS = 1000
+
 
 class EmbeddingModel:
     """
@@ -16,23 +24,131 @@ class EmbeddingModel:
     
     Uses sentence-transformers to create dense vector representations
     of text for semantic similarity and retrieval.
+
+    CPU inference threads default to the machine's core count; set the
+    RAG_TORCH_THREADS environment variable to override.
     """
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_capacity: int = 1024,
+                 backend: str = "torch", precision: str = "fp32",
+                 cache_dir: Optional[Path] = None):
         """
         Initialize the embedding model.
-        
+
         Args:
             model_name: HuggingFace model name (default: all-MiniLM-L6-v2, ~80MB)
+            cache_capacity: Maximum number of single-text embeddings to
+                keep in the in-process LRU cache (0 disables caching)
+            backend: 'torch' for sentence-transformers, 'onnx' for an
+                exported onnxruntime session (faster CPU inference;
+                requires the optimum package)
+            precision: 'fp32' or 'fp16'; half precision halves embedding
+                memory with negligible drift for cosine similarity
+            cache_dir: Directory for persisting embeddings as float16
+                .npy files keyed by content hash; warm embed_batch runs
+                skip the forward pass for unchanged texts
         """
         self.model_name = model_name
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.backend = backend.lower()
+        self.precision = precision.lower()
         self.model = None
+        self._tokenizer = None
+        # LRU cache for embed_text: repeated queries skip the forward pass
+        self._cache = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_capacity = cache_capacity
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Cache key over the exact text.
+
+        The model is case- and whitespace-sensitive, so distinct inputs
+        must never share a key. blake2b is faster than sha256 on short
+        inputs and a 16-byte digest is plenty for cache keying (this is
+        not a security boundary).
+        """
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
         
     def load_model(self) -> None:
         """Load the embedding model."""
         print(f"Loading embedding model: {self.model_name}...")
-        self.model = SentenceTransformer(self.model_name)
+        if self.backend == "onnx":
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+            from transformers import AutoTokenizer
+
+            model_id = self.model_name
+            if "/" not in model_id:
+                model_id = f"sentence-transformers/{model_id}"
+            self.model = ORTModelForFeatureExtraction.from_pretrained(
+                model_id, export=True, provider="CPUExecutionProvider"
+            )
+            self._tokenizer = AutoTokenizer.from_pretrained(model_id)
+        else:
+            # Best-effort thread pinning: some distros leave torch at one
+            # intra-op thread, wasting the other cores during inference.
+            # The env vars only take effect if BLAS isn't initialized yet.
+            num_threads = int(os.environ.get("RAG_TORCH_THREADS", os.cpu_count() or 1))
+            os.environ.setdefault("OMP_NUM_THREADS", str(num_threads))
+            os.environ.setdefault("MKL_NUM_THREADS", str(num_threads))
+
+            import torch
+            torch.set_num_threads(num_threads)
+            try:
+                torch.set_num_interop_threads(1)
+            except RuntimeError:
+                # Raises once parallel work has already started
+                pass
+
+            # Deferred: the heaviest import in the tree, paid only when
+            # a model is actually loaded
+            from sentence_transformers import SentenceTransformer
+
+            self.model = SentenceTransformer(self.model_name)
+
+            # Run the forward pass itself in half precision on CUDA;
+            # on CPU only the returned arrays are downcast
+            if self.precision == "fp16" and torch.cuda.is_available():
+                self.model.half()
         print("Embedding model loaded successfully")
+
+    def _encode_onnx(self, texts: List[str]) -> np.ndarray:
+        """Tokenize, run the ONNX session, mean-pool, and L2-normalize."""
+        encoded = self._tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+        outputs = self.model(**encoded)
+        hidden = np.asarray(outputs.last_hidden_state)
+
+        # Mean pooling over the attention mask, as sentence-transformers does
+        mask = encoded["attention_mask"][:, :, None].astype(hidden.dtype)
+        embeddings = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.clip(norms, 1e-12, None)
+
+    def _encode(self, texts: List[str], show_progress: bool = False,
+                batch_size: int = 64) -> np.ndarray:
+        """Encode texts with whichever backend is loaded."""
+        if self.backend == "onnx":
+            if len(texts) <= batch_size:
+                embeddings = self._encode_onnx(texts)
+            else:
+                embeddings = np.vstack([
+                    self._encode_onnx(texts[i:i + batch_size])
+                    for i in range(0, len(texts), batch_size)
+                ])
+        else:
+            embeddings = self.model.encode(
+                texts,
+                convert_to_numpy=True,
+                show_progress_bar=show_progress,
+                batch_size=batch_size
+            )
+
+        if self.precision == "fp16" and embeddings.dtype != np.float16:
+            embeddings = embeddings.astype(np.float16)
+        return embeddings
         
     def embed_text(self, text: str) -> np.ndarray:
         """
@@ -46,30 +162,156 @@ class EmbeddingModel:
         """
         if self.model is None:
             raise ValueError("Model not loaded. Call load_model() first.")
-        
-        embedding = self.model.encode(text, convert_to_numpy=True)
+        if not text or not text.strip():
+            raise ValueError("Cannot embed empty text")
+
+        if self._cache_capacity <= 0:
+            return self._encode([text])[0]
+
+        key = self._cache_key(text)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached
+            self._cache_misses += 1
+
+        embedding = self._encode([text])[0]
+
+        with self._cache_lock:
+            self._cache[key] = embedding
+            while len(self._cache) > self._cache_capacity:
+                self._cache.popitem(last=False)
+
         return embedding
+
+    def warmup(self, queries: List[str]) -> None:
+        """
+        Pre-populate the embedding cache with common queries.
+
+        Args:
+            queries: Queries to encode (in a single batched forward pass)
+        """
+        embeddings = self.embed_batch(queries)
+        with self._cache_lock:
+            for query, embedding in zip(queries, embeddings):
+                self._cache[self._cache_key(query)] = embedding
+            while len(self._cache) > self._cache_capacity:
+                self._cache.popitem(last=False)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss statistics for the embedding cache.
+
+        Returns:
+            Dictionary with hit, miss, and size counts
+        """
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._cache)
+            }
     
-    def embed_batch(self, texts: List[str], show_progress: bool = False) -> np.ndarray:
+    def embed_batch(self, texts: List[str], show_progress: bool = False,
+                    batch_size: int = 64, num_workers: int = 0) -> np.ndarray:
         """
         Generate embeddings for multiple texts.
-        
+
+        Output order always matches input order. With cache_dir set,
+        embeddings are persisted per text as float16 .npy files keyed
+        by content hash, so repeated runs only embed texts not seen
+        before (half precision does not change cosine ordering).
+
         Args:
             texts: List of input texts
             show_progress: Whether to show progress bar
-            
+            batch_size: Number of texts per model forward pass
+            num_workers: Encode across this many worker processes; 0
+                keeps everything in-process (always used for small
+                corpora, where pool startup dominates)
+
         Returns:
             2D numpy array of embeddings (num_texts x embedding_dim)
         """
         if self.model is None:
             raise ValueError("Model not loaded. Call load_model() first.")
-        
-        embeddings = self.model.encode(
-            texts,
-            convert_to_numpy=True,
-            show_progress_bar=show_progress
-        )
-        return embeddings
+
+        if self.cache_dir is None or not texts:
+            return self._embed_batch_uncached(texts, show_progress=show_progress,
+                                              batch_size=batch_size,
+                                              num_workers=num_workers)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        paths = [self.cache_dir / f"{self._cache_key(text).hex()}.npy" for text in texts]
+        vectors = [np.load(path) if path.exists() else None for path in paths]
+
+        miss_idx = [i for i, vec in enumerate(vectors) if vec is None]
+        if miss_idx:
+            # One batched forward pass over the misses only
+            fresh = self._embed_batch_uncached([texts[i] for i in miss_idx],
+                                               show_progress=show_progress,
+                                               batch_size=batch_size,
+                                               num_workers=num_workers)
+            for i, vec in zip(miss_idx, fresh):
+                np.save(paths[i], vec.astype(np.float16))
+                vectors[i] = vec
+
+        target = np.float16 if self.precision == "fp16" else np.float32
+        return np.stack(vectors).astype(target)
+
+    def _embed_batch_uncached(self, texts: List[str], show_progress: bool = False,
+                              batch_size: int = 64, num_workers: int = 0) -> np.ndarray:
+        """embed_batch without the on-disk cache layer."""
+        use_pool = (num_workers > 0 and len(texts) >= _MULTIPROCESS_MIN_TEXTS
+                    and self.backend != "onnx")
+        if len(texts) <= 1 or (self.backend != "onnx" and not use_pool):
+            # SentenceTransformer.encode already sorts by length and
+            # restores order internally, so the in-process torch path
+            # needs no pre-sort (it would just re-tokenize everything)
+            return self._encode(list(texts), show_progress=show_progress,
+                                batch_size=batch_size)
+
+        # Sort by token length so each batch pads to a similar sequence
+        # length; neither the ONNX path nor encode_multi_process sorts
+        # globally on its own
+        tokenizer = self._tokenizer if self.backend == "onnx" else self.model.tokenizer
+        lengths = tokenizer(list(texts), add_special_tokens=False,
+                            return_length=True)["length"]
+        order = np.argsort(lengths)
+        sorted_texts = [texts[i] for i in order]
+
+        if use_pool:
+            import torch
+
+            # Size the pool to num_workers explicitly: the default
+            # spawns one worker per visible device, ignoring the
+            # requested parallelism entirely on CPU-only machines
+            if torch.cuda.is_available():
+                num_gpus = torch.cuda.device_count()
+                devices = [f"cuda:{i % num_gpus}" for i in range(num_workers)]
+            else:
+                devices = ["cpu"] * num_workers
+            pool = self.model.start_multi_process_pool(target_devices=devices)
+            try:
+                embeddings = self.model.encode_multi_process(
+                    sorted_texts, pool, batch_size=batch_size,
+                    chunk_size=max(64, len(texts) // (num_workers * 4))
+                )
+            finally:
+                self.model.stop_multi_process_pool(pool)
+            if self.precision == "fp16" and embeddings.dtype != np.float16:
+                embeddings = embeddings.astype(np.float16)
+        else:
+            embeddings = self._encode(sorted_texts,
+                                      show_progress=show_progress,
+                                      batch_size=batch_size)
+
+        # Restore input order
+        out = np.empty_like(embeddings)
+        out[order] = embeddings
+        return out
     
     def get_embedding_dimension(self) -> int:
         """
@@ -80,7 +322,9 @@ class EmbeddingModel:
         """
         if self.model is None:
             raise ValueError("Model not loaded. Call load_model() first.")
-        
+
+        if self.backend == "onnx":
+            return self.model.config.hidden_size
         return self.model.get_sentence_embedding_dimension()
 
 
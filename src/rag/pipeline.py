@@ -6,6 +6,7 @@ Retrieval-Augmented Generation for targeted summarization.
 """
 
 from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from .embeddings import EmbeddingModel, create_embedding_model
 from .retrieval import VectorRetriever, create_retriever
 from ..algorithms.extractive import ExtractiveSummarizer
@@ -59,18 +60,22 @@ class RAGPipeline:
         """
         if self.retriever is None:
             raise ValueError("Documents not indexed. Call index_documents() first.")
-        
+        if not query or not query.strip():
+            raise ValueError("Cannot query with empty text")
+        if summarization_method not in ("extractive", "statistical"):
+            raise ValueError(f"Unknown summarization method: {summarization_method}")
+
         # Retrieve relevant documents
         results = self.retriever.retrieve(query, top_k)
         
-        # Combine retrieved documents
-        retrieved_texts = [doc for doc, _, _ in results]
-        combined_text = " ".join(retrieved_texts)
+        # Combine retrieved documents without materializing an
+        # intermediate list of (potentially large) strings
+        combined_text = " ".join(doc for doc, _, _ in results)
         
         # Generate summary
         if summarization_method == "extractive":
             summary = self.extractive_summarizer.summarize(combined_text, num_sentences)
-        else:
+        else:  # 'statistical', validated above
             summary = self.statistical_summarizer.summarize(combined_text, num_sentences)
         
         return {
@@ -103,19 +108,26 @@ class RAGPipeline:
         if self.retriever is None:
             raise ValueError("Documents not indexed. Call index_documents() first.")
         
-        # Retrieve documents
+        # Retrieve documents; unpack the result tuples once and reuse
         results = self.retriever.retrieve(query, top_k)
-        retrieved_texts = [doc for doc, _, _ in results]
-        combined_text = " ".join(retrieved_texts)
+        docs, doc_scores, metas = zip(*results) if results else ((), (), ())
+        combined_text = " ".join(docs)
         
-        # Generate summaries with different methods
-        extractive_summary = self.extractive_summarizer.summarize(combined_text, num_sentences)
-        statistical_summary = self.statistical_summarizer.summarize(combined_text, num_sentences)
+        # Generate summaries with both methods concurrently; they are
+        # independent and spend their time in GIL-releasing numpy/
+        # scikit-learn kernels, so two threads overlap the work
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            extractive_future = executor.submit(
+                self.extractive_summarizer.summarize, combined_text, num_sentences)
+            statistical_future = executor.submit(
+                self.statistical_summarizer.summarize, combined_text, num_sentences)
+            extractive_summary = extractive_future.result()
+            statistical_summary = statistical_future.result()
         
         return {
             "query": query,
             "retrieved_count": len(results),
-            "retrieval_scores": [score for _, score, _ in results],
+            "retrieval_scores": list(doc_scores),
             "summaries": {
                 "extractive": extractive_summary,
                 "statistical": statistical_summary
@@ -126,7 +138,7 @@ class RAGPipeline:
                     "similarity": score,
                     "metadata": meta
                 }
-                for doc, score, meta in results
+                for doc, score, meta in zip(docs, doc_scores, metas)
             ]
         }
 
@@ -6,59 +6,273 @@ dense vector representations and FAISS indexing.
 """
 
 from typing import List, Tuple, Optional
+from pathlib import Path
+import hashlib
+import math
+import pickle
 import numpy as np
 import faiss
 from .embeddings import EmbeddingModel
 
+# Below this corpus size, PQ training overhead outweighs its memory and
+# search-time wins, so build_index falls back to the uncompressed index
+_PQ_MIN_DOCUMENTS = 50_000
+
 
 class VectorRetriever:
     """
     FAISS-based vector retriever for semantic search.
-    
+
     Stores document embeddings in a FAISS index and retrieves
     the most semantically similar documents to a query.
+
+    All vectors are L2-normalized at add and query time, so the
+    inner-product search is cosine similarity computed as one BLAS
+    matrix product (flat index) or a graph walk (HNSW) — never a
+    per-document Python loop.
     """
     
-    def __init__(self, embedding_model: EmbeddingModel):
+    def __init__(self, embedding_model: EmbeddingModel, index_type: str = "hnsw",
+                 compressed: bool = False, quantization: Optional[str] = None,
+                 use_gpu: Optional[bool] = None,
+                 cache_dir: Optional[Path] = None, num_workers: int = 0):
         """
         Initialize the retriever.
-        
+
         Args:
             embedding_model: Loaded embedding model
+            index_type: 'hnsw' for approximate graph search (fast on
+                large corpora) or 'flat' for exact brute-force search
+            compressed: Use product quantization (IndexIVFPQ) to shrink
+                stored vectors ~32x; only applied above a corpus-size
+                threshold where the k-means training pays off
+            quantization: 'int8' stores 8-bit codes with trained
+                per-dimension scales, quartering index memory versus
+                float32 with near-identical ranking; None keeps full
+                precision
+            use_gpu: Run searches on a FAISS GPU index; None auto-detects
+                and silently stays on CPU when no GPU is available
+            cache_dir: Directory for persisting built indexes; warm runs
+                with unchanged documents skip re-embedding entirely
+            num_workers: Worker processes for corpus embedding during
+                build_index; 0 embeds in-process
         """
         self.embedding_model = embedding_model
+        self.index_type = index_type.lower()
+        self.compressed = compressed
+        self.quantization = quantization.lower() if quantization else None
+        if use_gpu is None:
+            use_gpu = hasattr(faiss, "get_num_gpus") and faiss.get_num_gpus() > 0
+        self.use_gpu = use_gpu
+        self._gpu_res = None
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.num_workers = num_workers
         self.index = None
         self.documents = []
         self.metadata = []
         
-    def build_index(self, documents: List[str], metadata: Optional[List[dict]] = None) -> None:
+    def build_index(self, documents: List[str], metadata: Optional[List[dict]] = None,
+                    batch_size: int = 64) -> None:
         """
         Build FAISS index from documents.
-        
+
         Args:
             documents: List of text documents
             metadata: Optional list of metadata dicts for each document
+            batch_size: Number of documents per embedding forward pass
         """
         if not documents:
             raise ValueError("Cannot build index from empty document list")
-        
+
+        fingerprint = None
+        if self.cache_dir is not None:
+            fingerprint = self._index_fingerprint(documents, metadata)
+            if self._load_cached_index(fingerprint):
+                return
+
         print(f"Building index for {len(documents)} documents...")
-        
+
         # Store documents and metadata
         self.documents = documents
         self.metadata = metadata if metadata else [{} for _ in documents]
         
-        # Generate embeddings
-        embeddings = self.embedding_model.embed_batch(documents, show_progress=True)
-        
+        # Embed each distinct text once; duplicate documents (common in
+        # scraped corpora) reuse the vector instead of a forward pass
+        unique_to_idx = {}
+        unique_texts = []
+        doc_to_unique = np.empty(len(documents), dtype=np.int64)
+        for i, doc in enumerate(documents):
+            idx = unique_to_idx.get(doc)
+            if idx is None:
+                idx = len(unique_texts)
+                unique_to_idx[doc] = idx
+                unique_texts.append(doc)
+            doc_to_unique[i] = idx
+
+        num_duplicates = len(documents) - len(unique_texts)
+        if num_duplicates:
+            print(f"Skipping embedding for {num_duplicates} duplicate documents")
+
+        # Generate embeddings, L2-normalized so inner product == cosine.
+        # FAISS always takes float32 at the API boundary; fp16 models get
+        # a scalar-quantized index that stores half precision internally.
+        embeddings = self.embedding_model.embed_batch(unique_texts, show_progress=True,
+                                                      batch_size=batch_size,
+                                                      num_workers=self.num_workers)
+        if num_duplicates:
+            # Restore one row per document so index ids stay aligned
+            embeddings = embeddings[doc_to_unique]
+        self._create_index(embeddings)
+
+        if fingerprint is not None:
+            self._save_index_cache(fingerprint)
+
+        if self.use_gpu:
+            self.index = self._to_gpu(self.index)
+
+        print(f"Index built successfully with {self.index.ntotal} vectors")
+
+    def build_index_precomputed(self, documents: List[str], embeddings: np.ndarray,
+                                metadata: Optional[List[dict]] = None) -> None:
+        """
+        Build the FAISS index from already-computed embeddings.
+
+        Skips the embedding model entirely, so callers that batch their
+        own embeddings (or share one matrix across retrievers) pay no
+        second forward pass.
+
+        Args:
+            documents: List of text documents, row-aligned with embeddings
+            embeddings: 2D array of document embeddings
+            metadata: Optional list of metadata dicts for each document
+        """
+        if not documents:
+            raise ValueError("Cannot build index from empty document list")
+        # Copy: normalization below is in-place and the caller may keep
+        # reusing (or sharing) the matrix it handed us
+        embeddings = np.array(embeddings, copy=True)
+        if len(documents) != embeddings.shape[0]:
+            raise ValueError("documents and embeddings must have the same length")
+
+        self.documents = documents
+        self.metadata = metadata if metadata else [{} for _ in documents]
+        self._create_index(embeddings)
+
+        if self.use_gpu:
+            self.index = self._to_gpu(self.index)
+
+        print(f"Index built successfully with {self.index.ntotal} vectors")
+
+    def _create_index(self, embeddings: np.ndarray) -> None:
+        """Normalize embeddings and build the configured FAISS index."""
+        store_fp16 = embeddings.dtype == np.float16
+        embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+        faiss.normalize_L2(embeddings)
+
         # Create FAISS index
-        dimension = embeddings.shape[1]
-        self.index = faiss.IndexFlatL2(dimension)  # L2 distance (Euclidean)
-        
+        num_docs, dimension = embeddings.shape
+        if self.compressed and num_docs > _PQ_MIN_DOCUMENTS:
+            # Product quantization: k-means inverted file plus 8-bit
+            # sub-quantizer codes; M must divide dimension (384/8 = 48)
+            nlist = int(4 * math.sqrt(num_docs))
+            quantizer = faiss.IndexFlatIP(dimension)
+            self.index = faiss.IndexIVFPQ(
+                quantizer, dimension, nlist, dimension // 8, 8,
+                faiss.METRIC_INNER_PRODUCT
+            )
+            self.index.train(embeddings)
+            self.index.nprobe = max(1, nlist // 16)
+        elif self.quantization == "int8":
+            # 8-bit scalar quantization: search decodes against int8
+            # codes (SIMD dot products) at a quarter of float32 traffic
+            self.index = faiss.IndexScalarQuantizer(
+                dimension, faiss.ScalarQuantizer.QT_8bit,
+                faiss.METRIC_INNER_PRODUCT
+            )
+            self.index.train(embeddings)
+        elif store_fp16:
+            self.index = faiss.IndexScalarQuantizer(
+                dimension, faiss.ScalarQuantizer.QT_fp16,
+                faiss.METRIC_INNER_PRODUCT
+            )
+        elif self.index_type == "hnsw":
+            # Graph-based ANN search: logarithmic instead of linear scans
+            self.index = faiss.IndexHNSWFlat(dimension, 32, faiss.METRIC_INNER_PRODUCT)
+            self.index.hnsw.efConstruction = 40
+            self.index.hnsw.efSearch = 16
+        else:
+            self.index = faiss.IndexFlatIP(dimension)
+
         # Add embeddings to index
-        self.index.add(embeddings.astype('float32'))
-        
-        print(f"Index built successfully with {self.index.ntotal} vectors")
+        self.index.add(embeddings)
+
+    def _index_fingerprint(self, documents: List[str],
+                           metadata: Optional[List[dict]] = None) -> str:
+        """Content hash over everything that shapes the persisted index.
+
+        Covers the model name, the index configuration, the documents,
+        and the metadata: a warm load must never hand back an index
+        built under a different index type or quantization, and
+        _load_cached_index restores metadata from the pickle, so stale
+        metadata has to miss the cache too.
+        """
+        config = f"{self.index_type}|{self.compressed}|{self.quantization}"
+        hasher = hashlib.sha256(self.embedding_model.model_name.encode())
+        hasher.update(config.encode())
+        for doc in documents:
+            hasher.update(b"|")
+            hasher.update(doc.encode())
+        if metadata:
+            hasher.update(pickle.dumps(metadata))
+        return hasher.hexdigest()[:16]
+
+    def _cache_paths(self, fingerprint: str) -> Tuple[Path, Path]:
+        return (self.cache_dir / f"{fingerprint}.faiss",
+                self.cache_dir / f"{fingerprint}.pkl")
+
+    def _load_cached_index(self, fingerprint: str) -> bool:
+        """Restore a persisted index; returns True on a cache hit."""
+        index_path, docs_path = self._cache_paths(fingerprint)
+        if not (index_path.exists() and docs_path.exists()):
+            return False
+
+        self.index = faiss.read_index(str(index_path))
+        with open(docs_path, "rb") as f:
+            self.documents, self.metadata = pickle.load(f)
+
+        if self.use_gpu:
+            self.index = self._to_gpu(self.index)
+
+        print(f"Loaded cached index with {self.index.ntotal} vectors")
+        return True
+
+    def _save_index_cache(self, fingerprint: str) -> None:
+        """Persist the built index and documents for warm restarts."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        index_path, docs_path = self._cache_paths(fingerprint)
+        faiss.write_index(self.index, str(index_path))
+        with open(docs_path, "wb") as f:
+            pickle.dump((self.documents, self.metadata), f)
+
+    def invalidate_cache(self) -> None:
+        """Delete all persisted indexes in the cache directory."""
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return
+        for pattern in ("*.faiss", "*.pkl"):
+            for path in self.cache_dir.glob(pattern):
+                path.unlink()
+
+    def _to_gpu(self, index):
+        """Move an index to GPU 0, falling back to CPU on any failure."""
+        try:
+            self._gpu_res = faiss.StandardGpuResources()
+            return faiss.index_cpu_to_gpu(self._gpu_res, 0, index)
+        except (AttributeError, RuntimeError):
+            # faiss-cpu build, no device, or an index type without GPU
+            # support (e.g. HNSW) - keep the CPU index
+            self.use_gpu = False
+            self._gpu_res = None
+            return index
     
     def retrieve(self, query: str, top_k: int = 5) -> List[Tuple[str, float, dict]]:
         """
@@ -74,26 +288,62 @@ class VectorRetriever:
         if self.index is None:
             raise ValueError("Index not built. Call build_index() first.")
         
-        # Generate query embedding
+        # Generate query embedding, normalized the same way as the
+        # index. Always copy first: embed_text hands back the array
+        # stored in its cache (reshape only makes a view), and
+        # normalize_L2 works in place, so skipping the copy would
+        # silently rescale the cached vector
         query_embedding = self.embedding_model.embed_text(query)
-        query_embedding = query_embedding.reshape(1, -1).astype('float32')
-        
-        # Search index
-        distances, indices = self.index.search(query_embedding, min(top_k, len(self.documents)))
-        
-        # Prepare results
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < len(self.documents):
-                # Convert L2 distance to similarity score (0-1, higher is better)
-                similarity = 1 / (1 + dist)
-                results.append((
-                    self.documents[idx],
-                    float(similarity),
-                    self.metadata[idx]
-                ))
-        
-        return results
+        query_embedding = np.array(query_embedding, dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(query_embedding)
+
+        # Search index; scores are cosine similarities directly
+        scores, indices = self.index.search(query_embedding, min(top_k, len(self.documents)))
+
+        return self._collect_results(scores[0], indices[0])
+
+    def retrieve_batch(self, queries: List[str], top_k: int = 5) -> List[List[Tuple[str, float, dict]]]:
+        """
+        Retrieve most similar documents for many queries at once.
+
+        Embeds all queries in one batch and issues a single FAISS search
+        call, amortizing the per-query Python/FAISS round-trip.
+
+        Args:
+            queries: Query texts
+            top_k: Number of documents to retrieve per query
+
+        Returns:
+            One result list per query, each like retrieve() output
+        """
+        if self.index is None:
+            raise ValueError("Index not built. Call build_index() first.")
+
+        if not queries:
+            return []
+
+        query_matrix = self.embedding_model.embed_batch(queries)
+        query_matrix = np.ascontiguousarray(query_matrix, dtype=np.float32)
+        faiss.normalize_L2(query_matrix)
+
+        scores, indices = self.index.search(query_matrix, min(top_k, len(self.documents)))
+
+        return [
+            self._collect_results(score_row, index_row)
+            for score_row, index_row in zip(scores, indices)
+        ]
+
+    def _collect_results(self, scores: np.ndarray, indices: np.ndarray) -> List[Tuple[str, float, dict]]:
+        """Turn one row of FAISS search output into result tuples.
+
+        Validity filtering happens vectorized in NumPy; only the final
+        tuple packing runs per hit in Python.
+        """
+        valid = (indices >= 0) & (indices < len(self.documents))
+        return [
+            (self.documents[idx], float(score), self.metadata[idx])
+            for score, idx in zip(scores[valid], indices[valid])
+        ]
     
     def get_index_stats(self) -> dict:
         """
@@ -1,10 +1,81 @@
 """Pytest configuration and shared fixtures."""
 
+import sys
+
 import pytest
 from pathlib import Path
 
+from src.algorithms.extractive import TextRankSummarizer, LexRankSummarizer, LuhnSummarizer
+from src.algorithms.statistical import TFIDFSummarizer, FrequencySummarizer
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def embedding_model():
+    """Shared embedding model; loading it is the slowest test setup step.
+
+    embed_text memoizes per text through the model's own LRU cache, so
+    repeated identical strings across the session (e.g. the consistency
+    test embedding the same sentence twice) cost one forward pass.
+    """
+    # Deferred import: metrics/data-only test runs never pay the
+    # sentence-transformers import
+    from src.rag.embeddings import EmbeddingModel
+
+    model = EmbeddingModel(cache_capacity=512)
+    model.load_model()
+    return model
+
+
+@pytest.fixture(scope="class")
+def textrank():
+    """One TextRank summarizer per test class."""
+    return TextRankSummarizer()
+
+
+@pytest.fixture(scope="class")
+def lexrank():
+    """One LexRank summarizer per test class."""
+    return LexRankSummarizer()
+
+
+@pytest.fixture(scope="class")
+def luhn():
+    """One Luhn summarizer per test class."""
+    return LuhnSummarizer()
+
+
+@pytest.fixture(scope="class")
+def tfidf():
+    """One TF-IDF summarizer per test class."""
+    return TFIDFSummarizer()
+
+
+@pytest.fixture(scope="class")
+def freq():
+    """One frequency summarizer per test class."""
+    return FrequencySummarizer()
+
+
+@pytest.fixture(scope="module")
+def tfidf_matrix(sample_text):
+    """Sparse TF-IDF matrix over sample_text's sentences, fit once.
+
+    Tests that only need sentence scores pass this to summarize() so
+    the vectorizer is not re-fit per test. Built with the same
+    preprocessing and sentence splitting summarize() applies —
+    summarize silently re-fits when the row count doesn't match its
+    own segmentation, so any other splitter would defeat the fixture.
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from src.algorithms.statistical import _split_sentences
+
+    summarizer = TFIDFSummarizer()
+    sentences = _split_sentences(summarizer._preprocess_text(sample_text))
+    vectorizer = TfidfVectorizer(stop_words='english')
+    return vectorizer.fit_transform(sentences)
+
+
+@pytest.fixture(scope="session")
 def sample_text():
     """Sample text for testing."""
     return """
@@ -33,7 +104,7 @@ def sample_text_invalid():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_articles():
     """Sample articles for testing."""
     return [
@@ -55,6 +126,23 @@ def sample_articles():
     ]
 
 
+@pytest.fixture(scope="session")
+def long_repeated_text():
+    """Long repeated text built (and interned) once per session."""
+    return sys.intern("This is a very long text. " * 10)
+
+
+@pytest.fixture(scope="session")
+def sample_articles_with_embeddings(embedding_model, sample_articles):
+    """Articles paired with their embeddings, computed once per session.
+
+    Retrieval tests that only need an index can pass these to
+    build_index_precomputed instead of re-embedding the same contents.
+    """
+    texts = [doc["content"] for doc in sample_articles]
+    return sample_articles, embedding_model.embed_batch(texts)
+
+
 @pytest.fixture
 def project_root():
     """Get project root directory."""
@@ -8,7 +8,8 @@ from src.utils.data import (
     get_available_categories,
     validate_text,
     clean_text,
-    chunk_text
+    chunk_text,
+    split_sentences_batch
 )
 
 
@@ -169,6 +170,27 @@ class TestCleanText:
         assert cleaned == ""
 
 
+class TestSplitSentencesBatch:
+    """Tests for batched sentence splitting."""
+
+    def test_splits_each_text(self):
+        """Test that each text yields its own sentence list."""
+        texts = [
+            "First sentence. Second sentence. Third sentence.",
+            "Only one sentence here."
+        ]
+        results = split_sentences_batch(texts)
+
+        assert len(results) == 2
+        assert len(results[0]) == 3
+        assert len(results[1]) == 1
+        assert results[0][0] == "First sentence."
+
+    def test_empty_input(self):
+        """Test with no texts."""
+        assert split_sentences_batch([]) == []
+
+
 class TestChunkText:
     """Tests for text chunking."""
     
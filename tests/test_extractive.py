@@ -7,51 +7,43 @@ from src.algorithms.extractive import TextRankSummarizer, LexRankSummarizer, Luh
 class TestTextRankSummarizer:
     """Tests for TextRank algorithm."""
     
-    def test_initialization(self):
+    def test_initialization(self, textrank):
         """Test summarizer initialization."""
-        summarizer = TextRankSummarizer()
-        assert summarizer is not None
+        assert textrank is not None
     
-    def test_single_summarization(self, sample_text):
+    def test_single_summarization(self, sample_text, textrank):
         """Test summarizing a single text."""
-        summarizer = TextRankSummarizer()
-        summary = summarizer.summarize(sample_text, num_sentences=3)
+        summary = textrank.summarize(sample_text, num_sentences=3)
         
         assert isinstance(summary, str)
         assert len(summary) > 0
         assert len(summary) < len(sample_text)
     
-    def test_custom_sentence_count(self, sample_text):
+    def test_custom_sentence_count(self, sample_text, textrank):
         """Test with different sentence counts."""
-        summarizer = TextRankSummarizer()
-        
-        summary_2 = summarizer.summarize(sample_text, num_sentences=2)
-        summary_4 = summarizer.summarize(sample_text, num_sentences=4)
+        summary_2 = textrank.summarize(sample_text, num_sentences=2)
+        summary_4 = textrank.summarize(sample_text, num_sentences=4)
         
         assert len(summary_2) < len(summary_4)
     
-    def test_batch_summarization(self, sample_text):
+    def test_batch_summarization(self, sample_text, textrank):
         """Test summarizing multiple texts."""
-        summarizer = TextRankSummarizer()
         texts = [sample_text, sample_text]
         
-        summaries = summarizer.summarize_batch(texts, num_sentences=3)
+        summaries = textrank.summarize_batch(texts, num_sentences=3)
         
         assert isinstance(summaries, list)
         assert len(summaries) == 2
         assert all(isinstance(s, str) for s in summaries)
     
-    def test_empty_text(self):
+    def test_empty_text(self, textrank):
         """Test with empty text."""
-        summarizer = TextRankSummarizer()
-        
         with pytest.raises(ValueError):
-            summarizer.summarize("", num_sentences=3)
+            textrank.summarize("", num_sentences=3)
     
-    def test_very_short_text(self, sample_text_short):
+    def test_very_short_text(self, sample_text_short, textrank):
         """Test with very short text."""
-        summarizer = TextRankSummarizer()
-        summary = summarizer.summarize(sample_text_short, num_sentences=2)
+        summary = textrank.summarize(sample_text_short, num_sentences=2)
         
         assert isinstance(summary, str)
         assert len(summary) > 0
@@ -60,15 +52,13 @@ class TestTextRankSummarizer:
 class TestLexRankSummarizer:
     """Tests for LexRank algorithm."""
     
-    def test_initialization(self):
+    def test_initialization(self, lexrank):
         """Test summarizer initialization."""
-        summarizer = LexRankSummarizer()
-        assert summarizer is not None
+        assert lexrank is not None
     
-    def test_single_summarization(self, sample_text):
+    def test_single_summarization(self, sample_text, lexrank):
         """Test summarizing a single text."""
-        summarizer = LexRankSummarizer()
-        summary = summarizer.summarize(sample_text, num_sentences=3)
+        summary = lexrank.summarize(sample_text, num_sentences=3)
         
         assert isinstance(summary, str)
         assert len(summary) > 0
@@ -80,12 +70,11 @@ class TestLexRankSummarizer:
         
         assert isinstance(summary, str)
     
-    def test_batch_summarization(self, sample_text):
+    def test_batch_summarization(self, sample_text, lexrank):
         """Test summarizing multiple texts."""
-        summarizer = LexRankSummarizer()
         texts = [sample_text, sample_text]
         
-        summaries = summarizer.summarize_batch(texts, num_sentences=3)
+        summaries = lexrank.summarize_batch(texts, num_sentences=3)
         
         assert len(summaries) == 2
 
@@ -93,15 +82,13 @@ class TestLexRankSummarizer:
 class TestLuhnSummarizer:
     """Tests for Luhn algorithm."""
     
-    def test_initialization(self):
+    def test_initialization(self, luhn):
         """Test summarizer initialization."""
-        summarizer = LuhnSummarizer()
-        assert summarizer is not None
+        assert luhn is not None
     
-    def test_single_summarization(self, sample_text):
+    def test_single_summarization(self, sample_text, luhn):
         """Test summarizing a single text."""
-        summarizer = LuhnSummarizer()
-        summary = summarizer.summarize(sample_text, num_sentences=3)
+        summary = luhn.summarize(sample_text, num_sentences=3)
         
         assert isinstance(summary, str)
         assert len(summary) > 0
@@ -113,22 +100,17 @@ class TestLuhnSummarizer:
         
         assert isinstance(summary, str)
     
-    def test_batch_summarization(self, sample_text):
+    def test_batch_summarization(self, sample_text, luhn):
         """Test summarizing multiple texts."""
-        summarizer = LuhnSummarizer()
         texts = [sample_text, sample_text]
         
-        summaries = summarizer.summarize_batch(texts, num_sentences=3)
+        summaries = luhn.summarize_batch(texts, num_sentences=3)
         
         assert len(summaries) == 2
 
 
-def test_all_algorithms_produce_different_results(sample_text):
+def test_all_algorithms_produce_different_results(sample_text, textrank, lexrank, luhn):
     """Test that different algorithms produce different summaries."""
-    textrank = TextRankSummarizer()
-    lexrank = LexRankSummarizer()
-    luhn = LuhnSummarizer()
-    
     summary_tr = textrank.summarize(sample_text, num_sentences=3)
     summary_lr = lexrank.summarize(sample_text, num_sentences=3)
     summary_lu = luhn.summarize(sample_text, num_sentences=3)
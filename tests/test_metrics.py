@@ -29,9 +29,9 @@ class TestCompressionRatio:
         
         assert ratio == 1.0
     
-    def test_high_compression(self):
+    def test_high_compression(self, long_repeated_text):
         """Test high compression scenario."""
-        original = "This is a very long text. " * 10
+        original = long_repeated_text
         summary = "Short summary."
         
         ratio = compression_ratio(original, summary)
@@ -7,52 +7,58 @@ from src.algorithms.statistical import TFIDFSummarizer, FrequencySummarizer
 class TestTFIDFSummarizer:
     """Tests for TF-IDF algorithm."""
     
-    def test_initialization(self):
+    def test_initialization(self, tfidf):
         """Test summarizer initialization."""
-        summarizer = TFIDFSummarizer()
-        assert summarizer is not None
+        assert tfidf is not None
     
-    def test_single_summarization(self, sample_text):
+    def test_single_summarization(self, sample_text, tfidf):
         """Test summarizing a single text."""
-        summarizer = TFIDFSummarizer()
-        summary = summarizer.summarize(sample_text, num_sentences=3)
+        summary = tfidf.summarize(sample_text, num_sentences=3)
         
         assert isinstance(summary, str)
         assert len(summary) > 0
         assert len(summary) < len(sample_text)
     
-    def test_custom_sentence_count(self, sample_text):
+    def test_custom_sentence_count(self, sample_text, tfidf):
         """Test with different sentence counts."""
-        summarizer = TFIDFSummarizer()
-        
-        summary_2 = summarizer.summarize(sample_text, num_sentences=2)
-        summary_4 = summarizer.summarize(sample_text, num_sentences=4)
+        summary_2 = tfidf.summarize(sample_text, num_sentences=2)
+        summary_4 = tfidf.summarize(sample_text, num_sentences=4)
         
         # More sentences should result in longer summary
         assert len(summary_2) < len(summary_4)
     
-    def test_batch_summarization(self, sample_text):
+    def test_batch_summarization(self, sample_text, tfidf):
         """Test summarizing multiple texts."""
-        summarizer = TFIDFSummarizer()
         texts = [sample_text, sample_text]
         
-        summaries = summarizer.summarize_batch(texts, num_sentences=3)
+        summaries = tfidf.summarize_batch(texts, num_sentences=3)
         
         assert isinstance(summaries, list)
         assert len(summaries) == 2
         assert all(isinstance(s, str) for s in summaries)
     
-    def test_empty_text(self):
+    def test_empty_text(self, tfidf):
         """Test with empty text."""
-        summarizer = TFIDFSummarizer()
-        
         with pytest.raises(ValueError):
-            summarizer.summarize("", num_sentences=3)
+            tfidf.summarize("", num_sentences=3)
     
-    def test_sentence_preservation(self, sample_text):
+    def test_precomputed_matrix(self, sample_text, tfidf, tfidf_matrix):
+        """Test reusing a precomputed TF-IDF matrix."""
+        from src.algorithms.statistical import _split_sentences
+
+        # The matrix is only consumed when its rows match summarize()'s
+        # own segmentation; a mismatch silently falls back to re-fitting
+        sentences = _split_sentences(tfidf._preprocess_text(sample_text))
+        assert tfidf_matrix.shape[0] == len(sentences)
+
+        summary = tfidf.summarize(sample_text, num_sentences=3, precomputed=tfidf_matrix)
+
+        assert isinstance(summary, str)
+        assert len(summary) > 0
+
+    def test_sentence_preservation(self, sample_text, tfidf):
         """Test that output contains complete sentences."""
-        summarizer = TFIDFSummarizer()
-        summary = summarizer.summarize(sample_text, num_sentences=3)
+        summary = tfidf.summarize(sample_text, num_sentences=3)
         
         # Summary should end with proper punctuation
         assert summary.strip()[-1] in ['.', '!', '?']
@@ -61,15 +67,13 @@ class TestTFIDFSummarizer:
 class TestFrequencySummarizer:
     """Tests for frequency-based algorithm."""
     
-    def test_initialization(self):
+    def test_initialization(self, freq):
         """Test summarizer initialization."""
-        summarizer = FrequencySummarizer()
-        assert summarizer is not None
+        assert freq is not None
     
-    def test_single_summarization(self, sample_text):
+    def test_single_summarization(self, sample_text, freq):
         """Test summarizing a single text."""
-        summarizer = FrequencySummarizer()
-        summary = summarizer.summarize(sample_text, num_sentences=3)
+        summary = freq.summarize(sample_text, num_sentences=3)
         
         assert isinstance(summary, str)
         assert len(summary) > 0
@@ -81,32 +85,26 @@ class TestFrequencySummarizer:
         
         assert isinstance(summary, str)
     
-    def test_batch_summarization(self, sample_text):
+    def test_batch_summarization(self, sample_text, freq):
         """Test summarizing multiple texts."""
-        summarizer = FrequencySummarizer()
         texts = [sample_text, sample_text]
         
-        summaries = summarizer.summarize_batch(texts, num_sentences=3)
+        summaries = freq.summarize_batch(texts, num_sentences=3)
         
         assert len(summaries) == 2
     
-    def test_different_sentence_counts(self, sample_text):
+    def test_different_sentence_counts(self, sample_text, freq):
         """Test with various sentence counts."""
-        summarizer = FrequencySummarizer()
-        
-        summary_1 = summarizer.summarize(sample_text, num_sentences=1)
-        summary_3 = summarizer.summarize(sample_text, num_sentences=3)
-        summary_5 = summarizer.summarize(sample_text, num_sentences=5)
+        summary_1 = freq.summarize(sample_text, num_sentences=1)
+        summary_3 = freq.summarize(sample_text, num_sentences=3)
+        summary_5 = freq.summarize(sample_text, num_sentences=5)
         
         # Check increasing length
         assert len(summary_1) < len(summary_3) < len(summary_5)
 
 
-def test_statistical_methods_comparison(sample_text):
+def test_statistical_methods_comparison(sample_text, tfidf, freq):
     """Test that statistical methods produce valid summaries."""
-    tfidf = TFIDFSummarizer()
-    freq = FrequencySummarizer()
-    
     summary_tfidf = tfidf.summarize(sample_text, num_sentences=3)
     summary_freq = freq.summarize(sample_text, num_sentences=3)
     